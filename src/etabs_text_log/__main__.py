@@ -4,20 +4,64 @@ Simple script to find the latest two ETABS files and generate a diff summary.
 Usage:
     python -m etabs_text_log <directory>
 """
+import os
 import sys
 import argparse
+import filecmp
+import functools
+import hashlib
+import heapq
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple, Union
 
 from .parser import parse_et_file
-from .model import EtabsModel
 from .location import attach_story_and_grid_tags
 from .diffing import diff_models
 from .aggregate import aggregate_diff
 from .summarize import get_llm_client, summarize_diff_to_markdown
+from . import __version__
 
+if TYPE_CHECKING:
+    from .model import EtabsModel
 
-def find_latest_two_files(directory: str) -> Optional[Tuple[str, str]]:
+# ETABS model file extensions, compared case-insensitively
+_ET_SUFFIXES = frozenset({".$et", ".e2k", ".et"})
+
+# Files smaller than this are parsed in-process. Measured: starting a spawn-based
+# two-worker pool costs ~170 ms before importing openai, and pickling a parsed
+# model (with raw_sections) back to the parent costs ~75 ms per MiB of source
+# file, more than a simple line parse of the same data. Only very large models
+# can amortize that.
+_PARALLEL_PARSE_MIN_BYTES = 64 * 1024 * 1024
+
+# Modules whose source defines what a parsed model looks like; a change to any
+# of them invalidates the on-disk parse cache
+_PARSER_MODULES = ("parser.py", "model.py")
+
+# Cached parses kept on disk; older entries are pruned after each write.
+# Each entry is at least as large as its model file, and llm_call uses two.
+_CACHE_MAX_ENTRIES = 8
+
+
+def _iter_model_files(directory: str) -> Iterator[os.DirEntry]:
+    """Recursively yield directory entries for ETABS model files under directory."""
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_model_files(entry.path)
+            elif os.path.splitext(entry.name)[1].lower() in _ET_SUFFIXES and entry.is_file():
+                yield entry
+
+
+def find_latest_two_files(directory: str) -> Optional[Tuple[Path, Path]]:
     """
     Find the two most recent .$et or .e2k files in the given directory.
     
@@ -36,24 +80,171 @@ def find_latest_two_files(directory: str) -> Optional[Tuple[str, str]]:
         print(f"Error: Path is not a directory: {directory}", file=sys.stderr)
         return None
     
-    # Find all .$et and .e2k files
-    et_files = list(dir_path.glob("**/*.$et")) + list(dir_path.glob("**/*.e2k")) + list(dir_path.glob("**/*.et"))
+    # Find all .$et, .e2k and .et files in a single scandir walk, taking each
+    # mtime from the directory entry's cached stat
+    et_files = [(entry.stat().st_mtime_ns, entry.path) for entry in _iter_model_files(directory)]
     
     if len(et_files) < 2:
         print(f"Error: Found only {len(et_files)} ETABS file(s). Need at least 2 files.", file=sys.stderr)
         return None
     
-    # Sort by modification time, most recent first
-    et_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+    # Get the two most recent by modification time
+    (_, newer_file), (_, older_file) = heapq.nlargest(2, et_files)
+    
+    return (Path(older_file), Path(newer_file))
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_llm_client(use_openai: bool, model: str):
+    """Return a shared LLM client so repeated calls reuse its HTTP connection."""
+    return get_llm_client(use_openai=use_openai, model=model)
+
+
+def _cache_dir() -> Path:
+    """Directory holding pickled parse results, one file per model path."""
+    base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "etabs_text_log"
+
+
+def _parser_stamp() -> Tuple[int, ...]:
+    """Modification times of the parser sources (0 if not shipped as .py)."""
+    here = Path(__file__).parent
+    stamp = []
+    for name in _PARSER_MODULES:
+        try:
+            stamp.append((here / name).stat().st_mtime_ns)
+        except OSError:
+            stamp.append(0)
+    return tuple(stamp)
+
+
+def _model_cache_key(path: str) -> tuple:
+    """Identify a specific version of a model file and of the parser that reads it."""
+    st = os.stat(path)
+    return (os.path.abspath(path), st.st_mtime_ns, st.st_size, __version__, _parser_stamp())
+
+
+def _cache_file(key: tuple) -> Path:
+    """Cache entry for the model path in key; re-saves overwrite the same entry."""
+    digest = hashlib.sha256(key[0].encode("utf-8")).hexdigest()[:32]
+    return _cache_dir() / f"{digest}.pkl"
+
+
+def _read_cached_model(key: tuple) -> Optional["EtabsModel"]:
+    """Return the cached parse for key, or None on a miss or unreadable entry."""
+    try:
+        with open(_cache_file(key), "rb") as f:
+            # The key is stored first so stale entries are rejected without
+            # unpickling the model
+            if pickle.load(f) != key:
+                return None
+            model = pickle.load(f)
+    except Exception:
+        # Missing, corrupt or incompatible entry (truncated write, renamed class, ...)
+        return None
+    try:
+        # Mark as recently used so pruning keeps it
+        os.utime(_cache_file(key))
+    except OSError:
+        pass
+    return model
+
+
+def _write_cached_model(key: tuple, model: "EtabsModel") -> None:
+    """Store a parse result for key, ignoring any failure to write the cache."""
+    target = _cache_file(key)
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(key, f, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(model, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, target)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception:
+        # Unwritable directory, unpicklable or too deeply nested model, ...
+        return
+    _prune_cache(target.parent)
+
+
+def _prune_cache(cache_dir: Path) -> None:
+    """Delete all but the _CACHE_MAX_ENTRIES most recently used cache entries."""
+    try:
+        with os.scandir(cache_dir) as entries:
+            cached = [(entry.stat().st_mtime_ns, entry.path) for entry in entries if entry.name.endswith(".pkl")]
+    except OSError:
+        return
+    cached.sort(reverse=True)
+    for _, path in cached[_CACHE_MAX_ENTRIES:]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def _parse_pair(paths: List[str]) -> List["EtabsModel"]:
+    """Parse two model files, using worker processes only when both are large."""
+    if (os.cpu_count() or 1) > 1 and all(os.path.getsize(p) >= _PARALLEL_PARSE_MIN_BYTES for p in paths):
+        try:
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                futures = [executor.submit(parse_et_file, path) for path in paths]
+                return [future.result() for future in futures]
+        except (BrokenProcessPool, OSError, pickle.PicklingError, TypeError):
+            # Pool failed to start or a model could not be pickled back
+            # (unpicklable objects raise TypeError); parse in-process instead
+            pass
+    return [parse_et_file(path) for path in paths]
+
+
+def _load_models(older_file: Path, newer_file: Path, use_cache: bool = True) -> Tuple["EtabsModel", "EtabsModel"]:
+    """
+    Parse and location-tag both model files, reusing on-disk parses of unchanged files.
+    
+    Args:
+        older_file: Path to the older model file
+        newer_file: Path to the newer model file
+        use_cache: Whether to read and write the on-disk parse cache (default: True)
+        
+    Returns:
+        Tuple of (old_model, new_model)
+    """
+    # parse_et_file has always been given str paths; keep it that way until
+    # the parser is known to accept os.PathLike
+    paths = [os.fspath(older_file), os.fspath(newer_file)]
+    # Keys are taken before parsing, so a file saved mid-parse is re-parsed next time
+    keys = [_model_cache_key(path) for path in paths] if use_cache else [None, None]
+    models: List[Optional["EtabsModel"]] = [
+        _read_cached_model(key) if key is not None else None for key in keys
+    ]
+    missing = [i for i, m in enumerate(models) if m is None]
+    
+    if len(missing) == 2:
+        parsed = _parse_pair(paths)
+    else:
+        parsed = [parse_et_file(paths[i]) for i in missing]
+    
+    for i, m in zip(missing, parsed):
+        # Cache the untagged parse; tagging depends on location.py and is redone
+        if keys[i] is not None:
+            _write_cached_model(keys[i], m)
+        models[i] = m
     
-    # Get the two most recent
-    newer_file = str(et_files[0])
-    older_file = str(et_files[1])
+    # Tag locations
+    for m in models:
+        attach_story_and_grid_tags(m)
     
-    return (older_file, newer_file)
+    return models[0], models[1]
+
 
+def _no_changes_summary(old_label: str, new_label: str) -> str:
+    """Markdown summary returned when two model versions have no differences."""
+    return f"# {old_label} → {new_label}\n\nNo changes detected between these versions."
 
-def llm_call(older_file: str, newer_file: str, style: str = "short", use_llm: bool = True, model: str = "gpt-4o-mini") -> str:
+
+def llm_call(older_file: Union[str, os.PathLike], newer_file: Union[str, os.PathLike], style: str = "short", use_llm: bool = True, model: str = "gpt-4o-mini", use_cache: bool = True) -> str:
     """
     Process two ETABS model files and generate a markdown summary using LLM.
     
@@ -63,17 +254,23 @@ def llm_call(older_file: str, newer_file: str, style: str = "short", use_llm: bo
         style: Summary style - "short" or "detailed" (default: "short")
         use_llm: Whether to use OpenAI LLM (default: True)
         model: OpenAI model to use (default: "gpt-4o-mini")
+        use_cache: Whether to reuse parses of unchanged files, pickled under the
+            user cache directory (default: True)
         
     Returns:
         Markdown summary string
     """
-    # Parse models
-    old_model = parse_et_file(older_file)
-    new_model = parse_et_file(newer_file)
+    older_file, newer_file = Path(older_file), Path(newer_file)
     
-    # Tag locations
-    attach_story_and_grid_tags(old_model)
-    attach_story_and_grid_tags(new_model)
+    # Generate labels from file paths
+    old_label, new_label = older_file.stem, newer_file.stem
+    
+    # Byte-identical files (e.g. a re-save without edits) need no parsing at all
+    if filecmp.cmp(older_file, newer_file, shallow=False):
+        return _no_changes_summary(old_label, new_label)
+    
+    # Parse and tag models (parses cached on disk per file version)
+    old_model, new_model = _load_models(older_file, newer_file, use_cache=use_cache)
     
     # Compute diff
     raw_diff = diff_models(old_model, new_model)
@@ -82,11 +279,7 @@ def llm_call(older_file: str, newer_file: str, style: str = "short", use_llm: bo
     aggregated = aggregate_diff(raw_diff, old_model, new_model)
     
     # Get LLM client
-    llm = get_llm_client(use_openai=use_llm, model=model)
-    
-    # Generate labels from file paths
-    old_label = Path(older_file).stem
-    new_label = Path(newer_file).stem
+    llm = _cached_llm_client(use_llm, model)
     
     # Generate markdown summary
     summary = summarize_diff_to_markdown(
@@ -128,6 +321,11 @@ def main():
         default="gpt-4o-mini",
         help="OpenAI model to use (default: gpt-4o-mini)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse both files instead of reusing cached parses"
+    )
     
     args = parser.parse_args()
     
@@ -150,7 +348,8 @@ def main():
             newer_file,
             style=args.style,
             use_llm=not args.no_llm,
-            model=args.model
+            model=args.model,
+            use_cache=not args.no_cache
         )
         
         # Print summary to stdout